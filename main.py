@@ -12,9 +12,12 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+import operator
 import os
 import sys
+from collections.abc import Coroutine
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 from rich.console import Console
@@ -106,6 +109,9 @@ Environment Variables:
     return parser.parse_args()
 
 
+_ROW_FIELDS = operator.attrgetter("success", "partial", "input.title", "processing_time_ms")
+
+
 def display_results_table(results: list) -> None:
     """Display a summary table of enrichment results."""
     table = Table(title="Enrichment Results", show_lines=True)
@@ -117,28 +123,18 @@ def display_results_table(results: list) -> None:
     table.add_column("Time (ms)", justify="right")
 
     for result in results[:15]:  # Show first 15
-        status = "[green]Success" if result.success else "[red]Failed"
-        if result.partial:
-            status = "[yellow]Partial"
-
-        merchant = "N/A"
-        category = "N/A"
+        success, partial, title, processing_time_ms = _ROW_FIELDS(result)
 
-        if result.data:
-            # Get merchant name from entities array
-            merchant = result.data.get_merchant_name() or "N/A"
-
-            # Get category name using helper method
-            category = result.data.transaction.get_primary_category_name()
-
-        time_str = f"{result.processing_time_ms:.0f}" if result.processing_time_ms else "-"
+        status = "[green]Success" if success else "[red]Failed"
+        if partial:
+            status = "[yellow]Partial"
 
         table.add_row(
-            result.input.title[:40] + ("..." if len(result.input.title) > 40 else ""),
+            title[:40] + ("..." if len(title) > 40 else ""),
             status,
-            merchant,
-            category,
-            time_str,
+            result.get_merchant_name() or "N/A",
+            result.get_category_name() or "N/A",
+            f"{processing_time_ms:.0f}" if processing_time_ms else "-",
         )
 
     if len(results) > 15:
@@ -177,46 +173,45 @@ async def main() -> int:
     console.print()
 
     # Initialize client and enricher
-    client = TriqaiClient(
+    async with TriqaiClient(
         api_key=api_key,
         max_concurrent=max_concurrent,
         request_delay=request_delay,
-    )
-
-    enricher = TransactionEnricher(
-        client=client,
-        output_dir=args.output_dir,
-    )
+    ) as client:
+        enricher = TransactionEnricher(
+            client=client,
+            output_dir=args.output_dir,
+        )
 
-    # Load transactions
-    console.print("[bold]Loading transactions...[/bold]")
-    transactions = enricher.load_transactions_from_csv(input_path)
-    console.print(f"Loaded [green]{len(transactions)}[/green] transactions\n")
+        # Load transactions
+        console.print("[bold]Loading transactions...[/bold]")
+        transactions = enricher.load_transactions_from_csv(input_path)
+        console.print(f"Loaded [green]{len(transactions)}[/green] transactions\n")
 
-    if args.dry_run:
-        console.print("[yellow]Dry run mode - skipping API calls[/yellow]")
-        for i, txn in enumerate(transactions[:5], 1):
-            console.print(f"  {i}. {txn.country} | {txn.type.value} | {txn.title[:50]}...")
-        if len(transactions) > 5:
-            console.print(f"  ... and {len(transactions) - 5} more")
-        return 0
+        if args.dry_run:
+            console.print("[yellow]Dry run mode - skipping API calls[/yellow]")
+            for i, txn in enumerate(transactions[:5], 1):
+                console.print(f"  {i}. {txn.country} | {txn.type.value} | {txn.title[:50]}...")
+            if len(transactions) > 5:
+                console.print(f"  ... and {len(transactions) - 5} more")
+            return 0
 
-    # Enrich with progress bar
-    console.print("[bold]Enriching transactions...[/bold]")
+        # Enrich with progress bar
+        console.print("[bold]Enriching transactions...[/bold]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Processing", total=len(transactions))
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Processing", total=len(transactions))
 
-        def update_progress(completed: int, total: int) -> None:
-            progress.update(task, completed=completed)
+            def update_progress(completed: int, total: int) -> None:
+                progress.update(task, completed=completed)
 
-        results = await enricher.enrich_transactions(transactions, update_progress)
+            results = await enricher.enrich_transactions(transactions, update_progress)
 
     console.print()
 
@@ -226,10 +221,10 @@ async def main() -> int:
     # Save results
     console.print("\n[bold]Saving results...[/bold]")
 
-    results_path = enricher.save_results(results, output_format=args.format)
+    results_path = await enricher.save_results_async(results, output_format=args.format)
     console.print(f"  Results saved to: [green]{results_path}[/green]")
 
-    summary_path = enricher.save_summary(results)
+    summary_path = await enricher.save_summary_async(results)
     console.print(f"  Summary saved to: [green]{summary_path}[/green]")
 
     # Print summary statistics
@@ -259,9 +254,19 @@ async def main() -> int:
     return 0
 
 
+def run(coro: Coroutine[Any, Any, int]) -> int:
+    """Run *coro* on uvloop's faster event loop when it is available (not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    exit_code: int = uvloop.run(coro)
+    return exit_code
+
+
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        exit_code = run(main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user[/yellow]")
@@ -5,12 +5,15 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterable, Sized
+from contextlib import aclosing
+from typing import TYPE_CHECKING, TypeVar, cast
 
 import httpx
+import orjson
 from tenacity import (
+    AsyncRetrying,
     RetryError,
-    retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
@@ -26,10 +29,22 @@ from .models import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+async def _aiter(source: Iterable[_T] | AsyncIterable[_T]) -> AsyncIterator[_T]:
+    """Iterate a sync or async iterable uniformly with ``async for``."""
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
 
 class TriqaiAPIError(Exception):
     """Base exception for Triqai API errors."""
@@ -81,6 +96,15 @@ class ServiceUnavailableError(TriqaiAPIError):
         self.retry_after_seconds = retry_after_seconds
 
 
+# Status codes that will fail every request, so they abort a batch instead of
+# being recorded as a failed result.
+_FATAL_ERRORS: dict[int, type[TriqaiAPIError]] = {
+    401: AuthenticationError,
+    402: InsufficientCreditsError,
+    403: ForbiddenError,
+}
+
+
 class TriqaiClient:
     """Async client for the Triqai Transaction Enrichment API.
 
@@ -88,14 +112,16 @@ class TriqaiClient:
     Paid plans can raise these via env vars or constructor args.
 
     Features:
+    - Connection pooling: one HTTP/2 client is reused for the client's lifetime
     - RPS throttle: enforces min delay between dispatching requests
-    - Concurrency cap: semaphore limits parallel in-flight requests
+    - Concurrency cap: limits parallel in-flight requests; resizable mid-batch
     - 429/503 handling: honours Retry-After header (seconds) before retrying
     - Exponential backoff on transient failures
     """
 
     BASE_URL = "https://api.triqai.com"
     ENRICH_ENDPOINT = "/v1/transactions/enrich"
+    BATCH_ENDPOINT = "/v1/transactions/enrich/batch"
 
     def __init__(
         self,
@@ -122,11 +148,37 @@ class TriqaiClient:
         self.timeout = timeout
         self.max_retries = max_retries
 
-        self._semaphore: asyncio.Semaphore | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # In-flight request slots for enrich_batch. The live limit can shrink below
+        # max_concurrent when the server reports few free concurrency slots.
+        self._slot_cond: asyncio.Condition | None = None
+        self._slot_cond_loop: asyncio.AbstractEventLoop | None = None
+        self._inflight = 0
+        self._concurrency_limit = max_concurrent
         self._rate_limit_info: RateLimitInfo | None = None
         self._rate_limit_lock = asyncio.Lock()
-        self._last_request_time = 0.0
+        self._resume_info: RateLimitInfo | None = None  # drained-bucket info _resume_at was set from
+        self._resume_at = 0.0  # time.monotonic() at which a drained bucket has refilled
+        self._last_request_time = 0.0  # time.monotonic() of the last reserved dispatch slot
+        self._dynamic_delay = 0.0  # header-derived pacing, applied on top of request_delay
         self._limits_adapted = False  # True once server-reported limits have been applied
+        self._bulk_supported = True  # False once the server answered 404 on BATCH_ENDPOINT
+        self._retryer = AsyncRetrying(
+            retry=retry_if_exception_type((RateLimitError, ServiceUnavailableError)),
+            stop=stop_after_attempt(self.max_retries),
+            wait=wait_exponential(multiplier=1, min=2, max=60),
+            reraise=True,
+        )
+        # Response handlers by status code; anything else is a per-transaction error.
+        self._status_handlers: dict[
+            int, Callable[[httpx.Response, Transaction, float], EnrichmentResult]
+        ] = {
+            200: self._handle_success,
+            401: self._raise_fatal_error,
+            402: self._raise_fatal_error,
+            403: self._raise_fatal_error,
+        }
 
     def _get_headers(self) -> dict[str, str]:
         """Get request headers with authentication."""
@@ -136,28 +188,85 @@ class TriqaiClient:
             "Accept": "application/json",
         }
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        The client (and its connection pool) is bound to the event loop it was
+        created on, so a new one is built if called from a different loop --
+        e.g. when ``asyncio.run`` is invoked more than once.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                headers=self._get_headers(),
+                timeout=self.timeout,
+                # No pool caps: in-flight requests are already bounded by the slot
+                # limit, which set_concurrency() and plan limits resize at runtime,
+                # whereas pool limits would stay fixed at the initial max_concurrent.
+                limits=httpx.Limits(
+                    max_keepalive_connections=None,
+                    max_connections=None,
+                    keepalive_expiry=30.0,
+                ),
+                http2=True,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def __aenter__(self) -> TriqaiClient:
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     async def _wait_for_rate_limit(self) -> None:
         """Wait if the RPS bucket is exhausted, then enforce the per-request delay."""
-        async with self._rate_limit_lock:
-            if self._rate_limit_info and self._rate_limit_info.remaining == 0:
-                # Retry-After (seconds) is the authoritative signal on 429
-                retry_after = self._rate_limit_info.get_retry_after_seconds()
-                if retry_after and retry_after > 0:
-                    logger.warning(f"Rate limit reached. Waiting {retry_after:.1f}s (Retry-After)...")
-                    await asyncio.sleep(retry_after + 0.1)  # small buffer
-                else:
-                    # Fall back to Reset timestamp
-                    reset_ts = self._rate_limit_info.get_reset_timestamp()
-                    if reset_ts:
-                        wait_time = max(0, reset_ts - time.time())
-                        if wait_time > 0:
+        info = self._rate_limit_info
+        if info and info.remaining == 0:
+            async with self._rate_limit_lock:
+                # Work out when the bucket refills once per drained-bucket response;
+                # every waiter then sleeps until that same deadline, concurrently.
+                if info is not self._resume_info:
+                    self._resume_info = info
+                    # Retry-After (seconds) is the authoritative signal on 429
+                    retry_after = info.get_retry_after_seconds()
+                    wait_time = 0.0
+                    if retry_after and retry_after > 0:
+                        logger.warning(f"Rate limit reached. Waiting {retry_after:.1f}s (Retry-After)...")
+                        wait_time = retry_after + 0.1  # small buffer
+                    else:
+                        # Fall back to Reset timestamp (wall clock, as sent by the server)
+                        reset_ts = info.get_reset_timestamp()
+                        if reset_ts and reset_ts > time.time():
+                            wait_time = reset_ts - time.time()
                             logger.warning(f"Rate limit reached. Waiting {wait_time:.1f}s until reset...")
-                            await asyncio.sleep(wait_time + 0.5)
-
-            # Enforce minimum inter-request delay (= 1/RPS)
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.request_delay:
-                await asyncio.sleep(self.request_delay - elapsed)
+                            wait_time += 0.5
+                    self._resume_at = max(self._resume_at, time.monotonic() + wait_time)
+                resume_at = self._resume_at
+            wait_time = resume_at - time.monotonic()
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+        # Enforce minimum inter-request delay (= 1/RPS, or slower when the server
+        # reports a draining bucket) by reserving the next
+        # dispatch slot. There is no await between reading and writing the slot,
+        # so this is atomic on the event loop without holding the lock.
+        now = time.monotonic()
+        next_allowed = self._last_request_time + max(self.request_delay, self._dynamic_delay)
+        if now < next_allowed:
+            self._last_request_time = next_allowed
+            await asyncio.sleep(next_allowed - now)
+        else:
+            self._last_request_time = now
 
     def _update_rate_limit_info(self, headers: httpx.Headers) -> None:
         """Update rate limit info from response headers.
@@ -166,8 +275,7 @@ class TriqaiClient:
         raises request_delay and max_concurrent to match the plan -- so paid-plan
         users get full speed without touching any config.
         """
-        self._rate_limit_info = RateLimitInfo.from_headers(dict(headers))
-        self._last_request_time = time.time()
+        self._rate_limit_info = RateLimitInfo.from_headers(headers)
 
         info = self._rate_limit_info
 
@@ -188,97 +296,178 @@ class TriqaiClient:
                     f"raising from {self.max_concurrent}"
                 )
                 self.max_concurrent = info.concurrency_limit
-                # Re-create the semaphore so in-flight batches pick up the new limit.
-                if self._semaphore is not None:
-                    self._semaphore = asyncio.Semaphore(self.max_concurrent)
+                # Waiting batch workers pick up the new limit on the next slot release.
+                self._concurrency_limit = self.max_concurrent
 
             if info.limit is not None or info.concurrency_limit is not None:
                 self._limits_adapted = True
 
+        # Track the org-wide free concurrency slots: back off when other clients
+        # are using them, grow back towards max_concurrent when they free up.
+        if info.concurrency_remaining is not None:
+            self._concurrency_limit = max(
+                1, min(self.max_concurrent, self._inflight + info.concurrency_remaining)
+            )
+
+        # Spread the remaining RPS budget evenly until the bucket resets, instead of
+        # bursting until it is empty and stalling (or collecting 429s).
+        if info.remaining is not None and (reset_ts := info.get_reset_timestamp()) is not None:
+            until_reset = reset_ts - time.time()
+            remaining = max(info.remaining, 1)
+            interval = until_reset / remaining
+            if remaining < self.max_concurrent:
+                # Fewer tokens than workers: slow down further before the bucket
+                # drains, but never past the reset itself.
+                interval = min(until_reset, interval * self.max_concurrent / remaining)
+            self._dynamic_delay = max(0.0, interval)
+        else:
+            self._dynamic_delay = 0.0
+
         if info.remaining is not None:
             logger.debug(f"RPS limit: {info.remaining}/{info.limit} remaining (scope={info.scope})")
         if info.concurrency_remaining is not None:
             logger.debug(f"Concurrency: {info.concurrency_remaining}/{info.concurrency_limit} remaining")
 
-    async def _make_request(
+    def _slot_condition(self) -> asyncio.Condition:
+        """Return the in-flight slot condition for the running event loop.
+
+        Like the HTTP client, it is bound to the loop it was created on. A new one
+        (with a fresh in-flight count) is only made for a different loop, never
+        while requests on the current loop may be waiting on it.
+        """
+        loop = asyncio.get_running_loop()
+        if self._slot_cond is None or self._slot_cond_loop is not loop:
+            self._slot_cond = asyncio.Condition()
+            self._slot_cond_loop = loop
+            self._inflight = 0
+        return self._slot_cond
+
+    async def _acquire_slot(self) -> None:
+        """Wait until an in-flight slot is free under the current concurrency limit."""
+        cond = self._slot_condition()
+        async with cond:
+            await cond.wait_for(lambda: self._inflight < self._concurrency_limit)
+            self._inflight += 1
+
+    async def _release_slot(self) -> None:
+        """Release an in-flight slot and wake as many waiters as there are free slots."""
+        cond = self._slot_condition()
+        async with cond:
+            self._inflight -= 1
+            cond.notify(self._concurrency_limit - self._inflight)
+
+    async def set_concurrency(self, limit: int) -> None:
+        """Change the maximum number of in-flight requests.
+
+        Takes effect immediately, including for a batch that is already running:
+        raising the limit wakes waiting requests, lowering it lets in-flight
+        requests finish without starting new ones.
+
+        Args:
+            limit: New maximum number of concurrent in-flight requests (>= 1).
+        """
+        cond = self._slot_condition()
+        async with cond:
+            self.max_concurrent = max(1, limit)
+            self._concurrency_limit = self.max_concurrent
+            cond.notify_all()
+
+    async def _send_request(
         self,
         client: httpx.AsyncClient,
-        transaction: Transaction,
-    ) -> EnrichmentResult:
-        """Make a single API request with retry logic."""
-        start_time = time.perf_counter()
+        body: bytes,
+        endpoint: str = ENRICH_ENDPOINT,
+    ) -> httpx.Response:
+        """Send one pre-serialized enrichment request, raising on retryable 429/503 responses."""
+        await self._wait_for_rate_limit()
 
-        @retry(
-            retry=retry_if_exception_type((RateLimitError, ServiceUnavailableError)),
-            stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential(multiplier=1, min=2, max=60),
-            reraise=True,
-        )
-        async def _request_with_retry() -> httpx.Response:
-            await self._wait_for_rate_limit()
+        response = await client.post(endpoint, content=body)
 
-            response = await client.post(
-                f"{self.BASE_URL}{self.ENRICH_ENDPOINT}",
-                json=transaction.to_api_request(),
-                headers=self._get_headers(),
-                timeout=self.timeout,
+        self._update_rate_limit_info(response.headers)
+
+        if response.status_code == 429:
+            retry_after = (
+                self._rate_limit_info.get_retry_after_seconds()
+                if self._rate_limit_info else None
+            )
+            scope = self._rate_limit_info.scope if self._rate_limit_info else None
+            raise RateLimitError(
+                f"Rate limit exceeded (scope={scope})",
+                retry_after_seconds=retry_after,
             )
 
-            self._update_rate_limit_info(response.headers)
+        if response.status_code == 503:
+            retry_after = (
+                self._rate_limit_info.get_retry_after_seconds()
+                if self._rate_limit_info else None
+            )
+            raise ServiceUnavailableError(retry_after_seconds=retry_after)
 
-            if response.status_code == 429:
-                retry_after = (
-                    self._rate_limit_info.get_retry_after_seconds()
-                    if self._rate_limit_info else None
-                )
-                scope = self._rate_limit_info.scope if self._rate_limit_info else None
-                raise RateLimitError(
-                    f"Rate limit exceeded (scope={scope})",
-                    retry_after_seconds=retry_after,
-                )
+        return response
 
-            if response.status_code == 503:
-                retry_after = (
-                    self._rate_limit_info.get_retry_after_seconds()
-                    if self._rate_limit_info else None
-                )
-                raise ServiceUnavailableError(retry_after_seconds=retry_after)
+    def _handle_success(
+        self,
+        response: httpx.Response,
+        transaction: Transaction,
+        processing_time: float,
+    ) -> EnrichmentResult:
+        """Build a result from a 200 response."""
+        success_response = EnrichSuccessResponse.model_validate_json(response.content)
+        return EnrichmentResult(
+            input=transaction,
+            success=True,
+            partial=success_response.partial,
+            data=success_response.data,
+            request_id=success_response.meta.requestId,
+            processing_time_ms=processing_time,
+        )
 
-            return response
+    def _raise_fatal_error(
+        self,
+        response: httpx.Response,
+        transaction: Transaction,
+        processing_time: float,
+    ) -> EnrichmentResult:
+        """Raise for errors that will fail every request (401, 402, 403)."""
+        error_response = ErrorResponse.model_validate_json(response.content)
+        raise _FATAL_ERRORS[response.status_code](error_response.error.message)
 
-        try:
-            response = await _request_with_retry()
-            processing_time = (time.perf_counter() - start_time) * 1000
+    def _handle_error(
+        self,
+        response: httpx.Response,
+        transaction: Transaction,
+        processing_time: float,
+    ) -> EnrichmentResult:
+        """Build a failed result for per-transaction errors.
 
-            if response.status_code == 200:
-                success_response = EnrichSuccessResponse.model_validate(response.json())
-                return EnrichmentResult(
-                    input=transaction,
-                    success=True,
-                    partial=success_response.partial,
-                    data=success_response.data,
-                    request_id=success_response.meta.requestId,
-                    processing_time_ms=processing_time,
-                )
+        409 (duplicate idempotency key), 422 (validation), 499, 500, 504 etc.
+        """
+        error_response = ErrorResponse.model_validate_json(response.content)
+        return EnrichmentResult(
+            input=transaction,
+            success=False,
+            error=error_response.error,
+            request_id=error_response.meta.requestId,
+            processing_time_ms=processing_time,
+        )
 
-            # Handle error responses
-            error_response = ErrorResponse.model_validate(response.json())
+    async def _make_request(self, transaction: Transaction) -> EnrichmentResult:
+        """Make a single API request with retry logic."""
+        client = await self._get_client()
+        start_time = time.perf_counter()
+        # Serialize once; retries resend the same bytes (Content-Type is a client header).
+        body = orjson.dumps(transaction.to_api_request())
 
-            if response.status_code == 401:
-                raise AuthenticationError(error_response.error.message)
-            elif response.status_code == 402:
-                raise InsufficientCreditsError(error_response.error.message)
-            elif response.status_code == 403:
-                raise ForbiddenError(error_response.error.message)
-            else:
-                # 409 (duplicate idempotency key), 422 (validation), 499, 500, 504 etc.
-                return EnrichmentResult(
-                    input=transaction,
-                    success=False,
-                    error=error_response.error,
-                    request_id=error_response.meta.requestId,
-                    processing_time_ms=processing_time,
-                )
+        try:
+            # copy() shares the policy objects but gets fresh per-call attempt state,
+            # which tenacity otherwise keeps per thread rather than per coroutine.
+            async for attempt in self._retryer.copy():
+                with attempt:
+                    response = await self._send_request(client, body)
+            processing_time = (time.perf_counter() - start_time) * 1000
+
+            handler = self._status_handlers.get(response.status_code, self._handle_error)
+            return handler(response, transaction, processing_time)
 
         except RetryError as e:
             processing_time = (time.perf_counter() - start_time) * 1000
@@ -313,6 +502,106 @@ class TriqaiClient:
                 processing_time_ms=processing_time,
             )
 
+    async def _make_bulk_request(self, chunk: list[Transaction]) -> list[EnrichmentResult] | None:
+        """Enrich a chunk of transactions in one request to the bulk endpoint.
+
+        Returns None if the server does not offer the bulk endpoint (404).
+        """
+        client = await self._get_client()
+        start_time = time.perf_counter()
+        body = orjson.dumps({"transactions": [txn.to_api_request() for txn in chunk]})
+
+        def _failed(error: ErrorDetail, request_id: str | None = None) -> list[EnrichmentResult]:
+            # Each transaction is charged its share of the chunk's round-trip.
+            processing_time = (time.perf_counter() - start_time) * 1000 / len(chunk)
+            return [
+                EnrichmentResult(
+                    input=txn,
+                    success=False,
+                    error=error,
+                    request_id=request_id,
+                    processing_time_ms=processing_time,
+                )
+                for txn in chunk
+            ]
+
+        try:
+            async for attempt in self._retryer.copy():
+                with attempt:
+                    response = await self._send_request(client, body, self.BATCH_ENDPOINT)
+        except RetryError as e:
+            logger.error(f"Max retries exceeded for bulk request of {len(chunk)} transactions")
+            return _failed(ErrorDetail(
+                code="max_retries_exceeded",
+                message=f"Failed after {self.max_retries} attempts: {e.last_attempt.exception()!s}",
+            ))
+        except httpx.TimeoutException:
+            logger.error(f"Timeout for bulk request of {len(chunk)} transactions")
+            return _failed(ErrorDetail(code="timeout", message=f"Request timed out after {self.timeout}s"))
+        except httpx.RequestError as e:
+            logger.error(f"Request error for bulk request of {len(chunk)} transactions - {e}")
+            return _failed(ErrorDetail(code="request_error", message=str(e)))
+
+        if response.status_code == 404:
+            return None
+        if response.status_code in _FATAL_ERRORS:
+            self._raise_fatal_error(response, chunk[0], 0.0)
+        if response.status_code != 200:
+            error_response = ErrorResponse.model_validate_json(response.content)
+            return _failed(error_response.error, error_response.meta.requestId)
+
+        # One single-enrichment response envelope per transaction, in request order.
+        # Anything else can't be matched back to the inputs, so the chunk fails as a whole.
+        try:
+            items = orjson.loads(response.content)["results"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            items = None
+        if (
+            not isinstance(items, list)
+            or len(items) != len(chunk)
+            or not all(isinstance(item, dict) for item in items)
+        ):
+            got = f"{len(items)} results" if isinstance(items, list) else "no results array"
+            logger.error(f"Malformed bulk response: {got} for {len(chunk)} transactions")
+            return _failed(ErrorDetail(
+                code="invalid_response",
+                message=f"Bulk response had {got} for {len(chunk)} transactions",
+            ))
+
+        processing_time = (time.perf_counter() - start_time) * 1000 / len(chunk)
+        succeeded = [item for item in items if item.get("success")]
+        success_responses = iter(EnrichSuccessResponse.validate_many(succeeded))
+        results = []
+        for txn, item in zip(chunk, items):
+            if item.get("success"):
+                success_response = next(success_responses)
+                results.append(EnrichmentResult(
+                    input=txn,
+                    success=True,
+                    partial=success_response.partial,
+                    data=success_response.data,
+                    request_id=success_response.meta.requestId,
+                    processing_time_ms=processing_time,
+                ))
+            else:
+                error_response = ErrorResponse.model_validate(item)
+                results.append(EnrichmentResult(
+                    input=txn,
+                    success=False,
+                    error=error_response.error,
+                    request_id=error_response.meta.requestId,
+                    processing_time_ms=processing_time,
+                ))
+        return results
+
+    async def _make_slotted_request(self, transaction: Transaction) -> EnrichmentResult:
+        """Make a single request while holding an in-flight slot."""
+        await self._acquire_slot()
+        try:
+            return await self._make_request(transaction)
+        finally:
+            await self._release_slot()
+
     async def enrich(self, transaction: Transaction) -> EnrichmentResult:
         """Enrich a single transaction.
 
@@ -322,59 +611,200 @@ class TriqaiClient:
         Returns:
             EnrichmentResult with enriched data or error information
         """
-        async with httpx.AsyncClient() as client:
-            return await self._make_request(client, transaction)
+        return await self._make_request(transaction)
+
+    async def _enrich_unordered(
+        self,
+        transactions: Iterable[Transaction] | AsyncIterable[Transaction],
+        progress_callback: Callable[[int, int], None] | None = None,
+        window: asyncio.Semaphore | None = None,
+    ) -> AsyncGenerator[tuple[int, EnrichmentResult], None]:
+        """Enrich transactions concurrently, yielding (index, result) as each completes.
+
+        Transactions are pulled from the source lazily and fed through a bounded
+        queue to a pool of worker tasks, so only O(max_concurrent) work is in
+        flight at once. If *window* is given, one permit is acquired per
+        transaction before it is queued; the caller releases it once done with
+        the result, which bounds how far the source is read ahead.
+        """
+        total = len(transactions) if isinstance(transactions, Sized) else None
+        fed = 0
+        completed = 0
+
+        queue: asyncio.Queue[tuple[int, Transaction] | None] = asyncio.Queue(
+            maxsize=self.max_concurrent * 2
+        )
+        done: asyncio.Queue[tuple[int, EnrichmentResult] | Exception | None] = asyncio.Queue()
+        workers: list[asyncio.Task[None]] = []
+
+        async def worker() -> None:
+            while (item := await queue.get()) is not None:
+                idx, txn = item
+                try:
+                    result = await self._make_slotted_request(txn)
+                except Exception as e:
+                    done.put_nowait(e)
+                    return
+                done.put_nowait((idx, result))
+
+        async def feed() -> None:
+            nonlocal fed
+            try:
+                async for txn in _aiter(transactions):
+                    if window is not None:
+                        await window.acquire()
+                    # Spawn workers lazily so a concurrency limit raised mid-batch is used.
+                    if len(workers) < self.max_concurrent:
+                        workers.append(asyncio.create_task(worker()))
+                    await queue.put((fed, txn))
+                    fed += 1
+
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers)
+            except Exception as e:
+                done.put_nowait(e)
+            else:
+                done.put_nowait(None)
+
+        feeder = asyncio.create_task(feed())
+        try:
+            while (item := await done.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                completed += 1
+
+                if progress_callback:
+                    progress_callback(completed, total if total is not None else fed)
+
+                result = item[1]
+                logger.debug(
+                    f"Completed {completed}/{total or fed}: {result.input.title[:40]}... "
+                    f"({'success' if result.success else 'failed'})"
+                )
+                yield item
+        finally:
+            feeder.cancel()
+            for task in workers:
+                task.cancel()
 
     async def enrich_batch(
         self,
-        transactions: list[Transaction],
+        transactions: Iterable[Transaction] | AsyncIterable[Transaction],
         progress_callback: Callable[[int, int], None] | None = None,
     ) -> list[EnrichmentResult]:
         """Enrich multiple transactions concurrently.
 
-        Uses a shared HTTP client for connection pooling across all requests,
-        with a semaphore to limit concurrency.
+        Requests share the client's pooled HTTP connections; in-flight requests
+        are capped by a resizable slot limit (see set_concurrency).
 
         Args:
-            transactions: List of transactions to enrich
+            transactions: Transactions to enrich -- a list, or any (async) iterable
             progress_callback: Optional callback(completed, total) for progress updates
 
         Returns:
             List of EnrichmentResults in the same order as input transactions
         """
+        if not isinstance(transactions, Sized):
+            return [result async for result in self.enrich_stream(transactions, progress_callback)]
+
         if not transactions:
             return []
 
-        self._semaphore = asyncio.Semaphore(self.max_concurrent)
-        completed = 0
-        total = len(transactions)
+        results: list[EnrichmentResult | None] = [None] * len(transactions)
+        async with aclosing(self._enrich_unordered(transactions, progress_callback)) as stream:
+            async for idx, result in stream:
+                results[idx] = result
 
-        async def process_one(
-            shared_client: httpx.AsyncClient, idx: int, txn: Transaction
-        ) -> tuple[int, EnrichmentResult]:
-            async with self._semaphore:
-                result = await self._make_request(shared_client, txn)
-                return idx, result
+        return cast("list[EnrichmentResult]", results)
 
-        async with httpx.AsyncClient() as client:
-            tasks = [process_one(client, i, txn) for i, txn in enumerate(transactions)]
+    async def enrich_batch_bulk(
+        self,
+        transactions: list[Transaction],
+        chunk_size: int = 50,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> list[EnrichmentResult]:
+        """Enrich transactions with one request per chunk via the bulk endpoint.
 
-            results_dict: dict[int, EnrichmentResult] = {}
+        Cuts round-trips from N to N / chunk_size. Chunks are sent concurrently
+        under the same rate and concurrency limits as enrich_batch. If the server
+        does not offer the bulk endpoint (404), this falls back to per-transaction
+        requests for the remaining transactions, and to enrich_batch for all
+        later calls.
 
-            for coro in asyncio.as_completed(tasks):
-                idx, result = await coro
-                results_dict[idx] = result
-                completed += 1
+        Args:
+            transactions: List of transactions to enrich
+            chunk_size: Transactions per bulk request
+            progress_callback: Optional callback(completed, total) for progress updates
 
-                if progress_callback:
-                    progress_callback(completed, total)
+        Returns:
+            List of EnrichmentResults in the same order as input transactions
+        """
+        if not self._bulk_supported or not transactions:
+            return await self.enrich_batch(transactions, progress_callback)
 
-                logger.debug(
-                    f"Completed {completed}/{total}: {result.input.title[:40]}... "
-                    f"({'success' if result.success else 'failed'})"
+        total = len(transactions)
+        results: list[EnrichmentResult | None] = [None] * total
+        completed = 0
+
+        async def process_chunk(start: int) -> None:
+            nonlocal completed
+            chunk = transactions[start:start + chunk_size]
+            await self._acquire_slot()
+            try:
+                chunk_results = (
+                    await self._make_bulk_request(chunk) if self._bulk_supported else None
                 )
+            finally:
+                await self._release_slot()
+
+            if chunk_results is None:
+                if self._bulk_supported:
+                    logger.info("Bulk endpoint not available -- falling back to per-transaction requests")
+                    self._bulk_supported = False
+                # Per-transaction requests take their own slots, shared with the other chunks.
+                chunk_results = await asyncio.gather(*map(self._make_slotted_request, chunk))
 
-        return [results_dict[i] for i in range(len(transactions))]
+            results[start:start + len(chunk)] = chunk_results
+            completed += len(chunk)
+            if progress_callback:
+                progress_callback(completed, total)
+
+        await asyncio.gather(*(process_chunk(i) for i in range(0, total, chunk_size)))
+        return cast("list[EnrichmentResult]", results)
+
+    async def enrich_stream(
+        self,
+        transactions: Iterable[Transaction] | AsyncIterable[Transaction],
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> AsyncIterator[EnrichmentResult]:
+        """Enrich transactions from a (possibly unbounded) source, yielding results in order.
+
+        The source is read lazily, at most ``4 * max_concurrent`` transactions ahead
+        of the last result yielded, so memory stays flat for inputs larger than RAM.
+
+        Args:
+            transactions: Any iterable or async iterable of transactions
+            progress_callback: Optional callback(completed, total) for progress updates.
+                               When the source has no length, total is the number
+                               of transactions read so far.
+
+        Yields:
+            EnrichmentResults in the same order as input transactions
+        """
+        window = asyncio.Semaphore(self.max_concurrent * 4)
+        pending: dict[int, EnrichmentResult] = {}
+        next_idx = 0
+
+        async with aclosing(
+            self._enrich_unordered(transactions, progress_callback, window)
+        ) as stream:
+            async for idx, result in stream:
+                pending[idx] = result
+                while next_idx in pending:
+                    yield pending.pop(next_idx)
+                    next_idx += 1
+                    window.release()
 
     @property
     def rate_limit_info(self) -> RateLimitInfo | None:
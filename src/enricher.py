@@ -2,21 +2,167 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
-import json
+import importlib.util
 import logging
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
+
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from .client import TriqaiClient
-from .models import EnrichmentResult, Transaction, TransactionType
+from .models import (
+    _TRANSACTION_TYPE_BY_VALUE,
+    _TRANSACTION_TYPE_VALUES,
+    EnrichmentResult,
+    Transaction,
+    TransactionType,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Sequence
 
 logger = logging.getLogger(__name__)
 
+_RESULT_ADAPTER = TypeAdapter(EnrichmentResult)
+_RESULTS_ADAPTER = TypeAdapter(list[EnrichmentResult])
+
+_TRANSACTIONS_ADAPTER = TypeAdapter(list[Transaction])
+_VALIDATION_CHUNK_SIZE = 1024  # CSV rows validated per TypeAdapter call
+
+_REPORT_RULE = "=" * 60 + "\n"
+_REPORT_SUBRULE = "-" * 40 + "\n"
+_SAMPLE_TMPL = "  '{t:.40}...'\n    -> Merchant: {m}\n    -> Category: {c}\n\n".format
+
+_CSV_COLUMNS = ("country", "type", "title", "comment")
+_FAST_CSV_MIN_BYTES = 1 << 20  # below this, pyarrow's import cost outweighs its speed
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB, amortizes write syscalls on large outputs
+_WRITE_BATCH_SIZE = 1 << 16  # JSONL bytes joined per write call
+_STREAM_JSON_THRESHOLD = 10_000  # above this many results, .json output is streamed
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (non-ASCII kept as-is, datetimes as ISO 8601)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+
+def _sniff_dialect(f: TextIO) -> type[csv.Dialect] | csv.Dialect:
+    """Auto-detect the delimiter from the start of the file (supports , and ;)."""
+    sample = f.read(4096)
+    f.seek(0)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",;")
+    except csv.Error:
+        return csv.excel  # fall back to comma
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp(epoch_second: int) -> str:
+    return datetime.fromtimestamp(epoch_second).strftime("%Y%m%d_%H%M%S")
+
+
+def _timestamp() -> str:
+    """Local-time stamp for default filenames, formatted at most once per second."""
+    return _format_timestamp(int(time.time()))
+
+
+def _validate_rows(rows: list[dict[str, Any]], row_nums: Sequence[int]) -> list[Transaction]:
+    """Validate a chunk of CSV rows at once, logging and skipping invalid ones."""
+    try:
+        return _TRANSACTIONS_ADAPTER.validate_python(rows)
+    except ValidationError as e:
+        problems: dict[int, list[str]] = {}
+        for error in e.errors():
+            idx, *field_loc = error["loc"]
+            problems.setdefault(int(idx), []).append(
+                f"{'.'.join(map(str, field_loc))}: {error['msg']}"
+            )
+        for idx, messages in problems.items():
+            logger.error(f"Row {row_nums[idx]}: Validation error - {'; '.join(messages)}")
+        return [
+            Transaction.model_validate(row)
+            for idx, row in enumerate(rows)
+            if idx not in problems
+        ]
+
+
+_SUCCESS = attrgetter("success")
+_PARTIAL = attrgetter("partial")
+_PROCESSING_TIME = attrgetter("processing_time_ms")
+_DATA = attrgetter("data")
+
+
+@dataclass
+class _ResultStats:
+    """Aggregate counts over a list of results."""
+
+    total: int = 0
+    successful: int = 0
+    partial: int = 0
+    failed: int = 0
+    total_time: float = 0.0
+    timed: int = 0
+    categories: Counter[str] = field(default_factory=Counter)
+    merchants_found: int = 0
+    locations_found: int = 0
+    intermediaries_found: int = 0
+    persons_found: int = 0
+
+    @property
+    def avg_time(self) -> float:
+        return self.total_time / self.timed if self.timed else 0
+
+    @classmethod
+    def collect(cls, results: list[EnrichmentResult], details: bool = False) -> _ResultStats:
+        """Tally outcomes and timing; with details, also categories and entities."""
+        stats = cls(total=len(results))
+        # Numeric tallies as C-level map/sum passes rather than a bytecode loop
+        successful = sum(map(_SUCCESS, results))
+        partial = sum(map(_PARTIAL, results))
+        times = list(filter(None, map(_PROCESSING_TIME, results)))
+        total_time = float(sum(times))
+        timed = len(times)
+
+        if details:
+            categories = stats.categories
+            for data in filter(None, map(_DATA, results)):
+                # Category stats - cached on the model
+                primary_cat = data.transaction.primary_category_name
+                # Raw dict categories can carry a null or non-string name; keys must be
+                # str for sys.intern and for orjson when the summary is written.
+                if not isinstance(primary_cat, str):
+                    primary_cat = "Unknown" if primary_cat is None else str(primary_cat)
+                categories[sys.intern(primary_cat)] += 1
+
+                # Entity stats - iterate entities array
+                if data.merchant:
+                    stats.merchants_found += 1
+                if data.location:
+                    stats.locations_found += 1
+                if data.intermediary:
+                    stats.intermediaries_found += 1
+                if data.person:
+                    stats.persons_found += 1
+
+        stats.successful = successful
+        stats.partial = partial
+        stats.failed = stats.total - successful
+        stats.total_time = total_time
+        stats.timed = timed
+        return stats
+
 
 class TransactionEnricher:
     """High-level interface for enriching transactions from files."""
@@ -49,42 +195,156 @@ class TransactionEnricher:
         Returns:
             List of Transaction objects
         """
-        transactions = []
         csv_path = Path(csv_path)
+        if csv_path.stat().st_size > _FAST_CSV_MIN_BYTES and _HAS_PYARROW:
+            transactions = self.load_transactions_from_csv_fast(csv_path)
+        else:
+            transactions = list(self.iter_transactions_from_csv(csv_path))
+        logger.debug(f"Loaded {len(transactions)} transactions from {csv_path}")
+        return transactions
+
+    def load_transactions_from_csv_fast(self, csv_path: str | Path) -> list[Transaction]:
+        """Load transactions from a CSV file using pyarrow's vectorized reader.
+
+        Same format, normalization and validation as load_transactions_from_csv,
+        but parsing and string cleanup run in C, which is much faster on large
+        files. load_transactions_from_csv picks this automatically for files over
+        1 MiB when pyarrow is installed (``pip install ".[fast]"``). Files with
+        blank lines go through the row-by-row reader, so logged row numbers
+        always match the file.
+
+        Args:
+            csv_path: Path to the CSV file
 
+        Returns:
+            List of Transaction objects
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from pyarrow import csv as pa_csv
+
+        csv_path = Path(csv_path)
         with csv_path.open("r", encoding="utf-8") as f:
-            # Auto-detect delimiter from the first line (supports , and ;)
-            sample = f.read(4096)
-            f.seek(0)
-            try:
-                dialect = csv.Sniffer().sniff(sample, delimiters=",;")
-            except csv.Error:
-                dialect = csv.excel  # fall back to comma
+            dialect = _sniff_dialect(f)
+
+        raw = csv_path.read_bytes()
+        if b"\n\n" in raw or b"\n\r\n" in raw:
+            # pyarrow drops blank lines, so its row indices would no longer match
+            # the file's row numbers; the row-by-row reader skips them but keeps counting.
+            return list(self.iter_transactions_from_csv(csv_path))
+
+        try:
+            table = pa_csv.read_csv(
+                pa.BufferReader(raw),
+                parse_options=pa_csv.ParseOptions(delimiter=dialect.delimiter),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in _CSV_COLUMNS},
+                    strings_can_be_null=False,
+                ),
+            )
+        except pa.ArrowInvalid as e:
+            # e.g. ragged rows -- the row-by-row reader reports these individually
+            logger.warning(f"Fast CSV reader failed ({e}); falling back to row-by-row parsing")
+            return list(self.iter_transactions_from_csv(csv_path))
+
+        columns = table.column_names
+        for required in ("title", "country"):
+            if required not in columns:
+                logger.error(f"Missing required column '{required}' in {csv_path}")
+                return []
+
+        if "type" in columns:
+            txn_type = pc.utf8_lower(pc.utf8_trim_whitespace(table["type"]))
+            invalid = pc.invert(pc.is_in(txn_type, value_set=pa.array(sorted(_TRANSACTION_TYPE_VALUES))))
+            for idx in pc.indices_nonzero(invalid).to_pylist():
+                logger.warning(
+                    f"Row {idx + 2}: Invalid type '{txn_type[idx].as_py()}', defaulting to 'expense'"
+                )
+            txn_type = pc.if_else(invalid, TransactionType.EXPENSE.value, txn_type)
+        else:
+            txn_type = pa.array([TransactionType.EXPENSE.value] * table.num_rows)
 
-            reader = csv.DictReader(f, dialect=dialect)
+        if "comment" in columns:
+            comment = pc.utf8_trim_whitespace(table["comment"])
+            comment = pc.if_else(pc.equal(comment, ""), pa.scalar(None, pa.string()), comment)
+        else:
+            comment = pa.nulls(table.num_rows, pa.string())
+
+        normalized = pa.table({
+            "title": pc.utf8_trim_whitespace(table["title"]),
+            "country": pc.utf8_upper(pc.utf8_trim_whitespace(table["country"])),
+            "type": txn_type,
+            "comment": comment,
+        })
+        return _validate_rows(normalized.to_pylist(), range(2, table.num_rows + 2))
+
+    def iter_transactions_from_csv(self, csv_path: str | Path) -> Iterator[Transaction]:
+        """Lazily read transactions from a CSV file, one row at a time.
+
+        Same format and validation as load_transactions_from_csv, but rows are
+        parsed on demand -- pass the iterator to TriqaiClient.enrich_stream to
+        enrich files larger than memory.
+
+        Args:
+            csv_path: Path to the CSV file
+
+        Yields:
+            Transaction objects, skipping (and logging) invalid rows
+        """
+        csv_path = Path(csv_path)
+
+        with csv_path.open("r", encoding="utf-8") as f:
+            dialect = _sniff_dialect(f)
+            reader = csv.reader(f, dialect=dialect)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            # Resolve column positions once; rows are then plain lists.
+            try:
+                i_title = header.index("title")
+                i_country = header.index("country")
+            except ValueError:
+                missing = "title" if "title" not in header else "country"
+                logger.error(f"Missing required column '{missing}' in {csv_path}")
+                return
+            i_type = header.index("type") if "type" in header else -1
+            i_comment = header.index("comment") if "comment" in header else -1
+
+            # Rows are validated in chunks through one TypeAdapter call each,
+            # which is much cheaper than one model construction per row.
+            rows: list[dict[str, Any]] = []
+            row_nums: list[int] = []
 
             for row_num, row in enumerate(reader, start=2):
+                if not row:  # blank line
+                    continue
                 try:
-                    txn_type = row.get("type", "expense").strip().lower()
-                    if txn_type not in ("expense", "income"):
-                        logger.warning(f"Row {row_num}: Invalid type '{txn_type}', defaulting to 'expense'")
-                        txn_type = "expense"
-
-                    transaction = Transaction(
-                        title=row["title"].strip(),
-                        country=row["country"].strip().upper(),
-                        type=TransactionType(txn_type),
-                        comment=row.get("comment", "").strip() or None,
-                    )
-                    transactions.append(transaction)
-
-                except KeyError as e:
-                    logger.error(f"Row {row_num}: Missing required column {e}")
-                except ValueError as e:
-                    logger.error(f"Row {row_num}: Validation error - {e}")
-
-        logger.debug(f"Loaded {len(transactions)} transactions from {csv_path}")
-        return transactions
+                    raw_type = row[i_type].strip().lower() if i_type >= 0 else "expense"
+                    txn_type = _TRANSACTION_TYPE_BY_VALUE.get(raw_type)
+                    if txn_type is None:
+                        logger.warning(f"Row {row_num}: Invalid type '{raw_type}', defaulting to 'expense'")
+                        txn_type = TransactionType.EXPENSE
+
+                    comment = row[i_comment].strip() if 0 <= i_comment < len(row) else ""
+                    rows.append({
+                        "title": row[i_title].strip(),
+                        "country": row[i_country].strip(),  # upper-cased and interned by Transaction
+                        "type": txn_type,
+                        "comment": comment or None,
+                    })
+                    row_nums.append(row_num)
+
+                except IndexError:
+                    logger.error(f"Row {row_num}: Missing required value(s), got {len(row)} columns")
+                    continue
+
+                if len(rows) >= _VALIDATION_CHUNK_SIZE:
+                    yield from _validate_rows(rows, row_nums)
+                    rows, row_nums = [], []
+
+            if rows:
+                yield from _validate_rows(rows, row_nums)
 
     async def enrich_transactions(
         self,
@@ -104,13 +364,12 @@ class TransactionEnricher:
         results = await self.client.enrich_batch(transactions, progress_callback)
 
         # Log summary
-        successful = sum(1 for r in results if r.success)
-        partial = sum(1 for r in results if r.partial)
-        failed = sum(1 for r in results if not r.success)
-
-        logger.debug(
-            f"Enrichment complete: {successful} successful, {partial} partial, {failed} failed"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            stats = _ResultStats.collect(results)
+            logger.debug(
+                f"Enrichment complete: {stats.successful} successful, "
+                f"{stats.partial} partial, {stats.failed} failed"
+            )
 
         return results
 
@@ -131,28 +390,56 @@ class TransactionEnricher:
             Path to the saved file
         """
         if filename is None:
-            filename = f"enrichments_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            filename = f"enrichments_{_timestamp()}"
 
         extension = ".jsonl" if output_format == "jsonl" else ".json"
         output_path = self.output_dir / f"{filename}{extension}"
 
-        # Convert results to serializable format
-        serializable_results = []
-        for result in results:
-            result_dict = result.model_dump(mode="json", exclude_none=True)
-            serializable_results.append(result_dict)
-
-        if output_format == "jsonl":
-            with output_path.open("w", encoding="utf-8") as f:
-                for result in serializable_results:
-                    f.write(json.dumps(result, ensure_ascii=False) + "\n")
-        else:
-            with output_path.open("w", encoding="utf-8") as f:
-                json.dump(serializable_results, f, indent=2, ensure_ascii=False)
+        # Serialize straight from the models to JSON bytes (pydantic-core, one pass).
+        # Large outputs are written record by record so memory stays flat.
+        with output_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            if output_format == "jsonl":
+                # Join lines into ~64 KiB blocks: one write call per block, not per line
+                lines: list[bytes] = []
+                pending = 0
+                for result in results:
+                    line = _RESULT_ADAPTER.dump_json(result, exclude_none=True)
+                    lines.append(line)
+                    pending += len(line) + 1
+                    if pending >= _WRITE_BATCH_SIZE:
+                        lines.append(b"")
+                        f.write(b"\n".join(lines))
+                        lines.clear()
+                        pending = 0
+                if lines:
+                    lines.append(b"")
+                    f.write(b"\n".join(lines))
+            elif len(results) > _STREAM_JSON_THRESHOLD:
+                # Same bytes as the one-shot dump: each record indented one level.
+                sep = b"[\n  "
+                for result in results:
+                    record = _RESULT_ADAPTER.dump_json(result, exclude_none=True, indent=2)
+                    f.write(sep + record.replace(b"\n", b"\n  "))
+                    sep = b",\n  "
+                f.write(b"\n]")
+            else:
+                f.write(_RESULTS_ADAPTER.dump_json(results, exclude_none=True, indent=2))
 
         logger.debug(f"Saved {len(results)} results to {output_path}")
         return output_path
 
+    async def save_results_async(
+        self,
+        results: list[EnrichmentResult],
+        filename: str | None = None,
+        output_format: str = "json",
+    ) -> Path:
+        """Like save_results, but encodes and writes in a worker thread.
+
+        Use from async code so a large save doesn't block the event loop.
+        """
+        return await asyncio.to_thread(self.save_results, results, filename, output_format)
+
     def save_summary(self, results: list[EnrichmentResult], filename: str | None = None) -> Path:
         """Save a summary report of the enrichment results.
 
@@ -164,73 +451,50 @@ class TransactionEnricher:
             Path to the saved summary file
         """
         if filename is None:
-            filename = f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            filename = f"summary_{_timestamp()}"
 
         output_path = self.output_dir / f"{filename}.json"
 
-        # Calculate statistics
-        total = len(results)
-        successful = sum(1 for r in results if r.success)
-        partial = sum(1 for r in results if r.partial)
-        failed = sum(1 for r in results if not r.success)
-
-        # Aggregate timing
-        processing_times = [r.processing_time_ms for r in results if r.processing_time_ms]
-        avg_time = sum(processing_times) / len(processing_times) if processing_times else 0
-        total_time = sum(processing_times)
-
-        # Count categories
-        categories: dict[str, int] = {}
-        merchants_found = 0
-        locations_found = 0
-        intermediaries_found = 0
-        persons_found = 0
-
-        for result in results:
-            if result.data:
-                # Category stats - use helper method
-                primary_cat = result.data.transaction.get_primary_category_name()
-                categories[primary_cat] = categories.get(primary_cat, 0) + 1
-
-                # Entity stats - iterate entities array
-                if result.data.merchant:
-                    merchants_found += 1
-                if result.data.location:
-                    locations_found += 1
-                if result.data.intermediary:
-                    intermediaries_found += 1
-                if result.data.person:
-                    persons_found += 1
+        stats = _ResultStats.collect(results, details=True)
+        total = stats.total
+        successful = stats.successful
+        total_time = stats.total_time
 
         summary = {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": datetime.now(),
             "statistics": {
                 "total_transactions": total,
                 "successful": successful,
-                "partial": partial,
-                "failed": failed,
+                "partial": stats.partial,
+                "failed": stats.failed,
                 "success_rate": f"{(successful / total * 100):.1f}%" if total > 0 else "0%",
             },
             "timing": {
                 "total_processing_ms": round(total_time, 2),
-                "average_processing_ms": round(avg_time, 2),
+                "average_processing_ms": round(stats.avg_time, 2),
                 "transactions_per_second": round(total / (total_time / 1000), 2) if total_time > 0 else 0,
             },
             "entities": {
-                "merchants_found": merchants_found,
-                "locations_found": locations_found,
-                "intermediaries_found": intermediaries_found,
-                "persons_found": persons_found,
+                "merchants_found": stats.merchants_found,
+                "locations_found": stats.locations_found,
+                "intermediaries_found": stats.intermediaries_found,
+                "persons_found": stats.persons_found,
             },
-            "categories": dict(sorted(categories.items(), key=lambda x: -x[1])),
+            "categories": dict(stats.categories.most_common()),
         }
 
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        with output_path.open("wb") as f:
+            f.write(_dumps(summary, indent=True))
 
         logger.debug(f"Saved summary to {output_path}")
         return output_path
 
+    async def save_summary_async(
+        self, results: list[EnrichmentResult], filename: str | None = None
+    ) -> Path:
+        """Like save_summary, but tallies and writes in a worker thread."""
+        return await asyncio.to_thread(self.save_summary, results, filename)
+
     def generate_report(self, results: list[EnrichmentResult]) -> str:
         """Generate a human-readable report of the enrichment results.
 
@@ -240,53 +504,41 @@ class TransactionEnricher:
         Returns:
             Formatted report string
         """
-        total = len(results)
-        successful = sum(1 for r in results if r.success)
-        partial = sum(1 for r in results if r.partial)
-        failed = sum(1 for r in results if not r.success)
-
-        processing_times = [r.processing_time_ms for r in results if r.processing_time_ms]
-        avg_time = sum(processing_times) / len(processing_times) if processing_times else 0
-        total_time = sum(processing_times)
-
-        report = [
-            "=" * 60,
-            "TRANSACTION ENRICHMENT REPORT",
-            "=" * 60,
-            "",
-            "SUMMARY",
-            "-" * 40,
-            f"  Total transactions:     {total}",
-            f"  Successful:             {successful} ({successful/total*100:.1f}%)" if total > 0 else "  Successful:             0",
-            f"  Partial results:        {partial}",
-            f"  Failed:                 {failed}",
-            "",
-            "TIMING",
-            "-" * 40,
-            f"  Total processing time:  {total_time/1000:.2f}s",
-            f"  Average per transaction: {avg_time:.0f}ms",
-            "",
+        stats = _ResultStats.collect(results)
+        total = stats.total
+        successful = stats.successful
+        successful_pct = f" ({successful/total*100:.1f}%)" if total else ""
+
+        parts: list[str] = [
+            _REPORT_RULE,
+            "TRANSACTION ENRICHMENT REPORT\n",
+            _REPORT_RULE,
+            "\n",
+            "SUMMARY\n",
+            _REPORT_SUBRULE,
+            f"  Total transactions:     {total}\n",
+            f"  Successful:             {successful}{successful_pct}\n",
+            f"  Partial results:        {stats.partial}\n",
+            f"  Failed:                 {stats.failed}\n",
+            "\n",
+            "TIMING\n",
+            _REPORT_SUBRULE,
+            f"  Total processing time:  {stats.total_time/1000:.2f}s\n",
+            f"  Average per transaction: {stats.avg_time:.0f}ms\n",
+            "\n",
+            # Show sample results
+            "SAMPLE RESULTS\n",
+            _REPORT_SUBRULE,
         ]
 
-        # Show sample results
-        report.extend([
-            "SAMPLE RESULTS",
-            "-" * 40,
-        ])
-
-        for result in results[:5]:
+        for result in islice(results, 5):
             if result.success and result.data:
-                # Get merchant name from entities array
-                merchant_name = result.data.get_merchant_name() or "N/A"
-
-                # Get category name using helper method
-                category = result.data.transaction.get_primary_category_name()
-
-                report.append(f"  '{result.input.title[:40]}...'")
-                report.append(f"    -> Merchant: {merchant_name}")
-                report.append(f"    -> Category: {category}")
-                report.append("")
+                parts.append(_SAMPLE_TMPL(
+                    t=result.input.title,
+                    m=result.get_merchant_name() or "N/A",
+                    c=result.get_category_name(),
+                ))
 
-        report.append("=" * 60)
+        parts.append("=" * 60)
 
-        return "\n".join(report)
+        return "".join(parts)
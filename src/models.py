@@ -5,11 +5,26 @@ Updated for API v1.1.0: entities array pattern with ConfidenceWithReasons.
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Annotated, Any, cast
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import (
+    AliasChoices,
+    AliasPath,
+    BaseModel,
+    BeforeValidator,
+    Field,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
 
 
 class TransactionType(str, Enum):
@@ -29,6 +44,11 @@ class TransactionChannel(str, Enum):
     BANK_TRANSFER = "bank_transfer"
     UNKNOWN = "unknown"
 
+    @classmethod
+    def _missing_(cls, value: object) -> TransactionChannel:
+        # Channels added to the API after this client was released
+        return cls.UNKNOWN
+
 
 class SubscriptionType(str, Enum):
     """Subscription category types."""
@@ -52,23 +72,52 @@ class EntityType(str, Enum):
     PERSON = "person"
 
 
+# Value -> member lookup tables. A dict miss is cheap, whereas Enum(value) raises
+# and catches a KeyError internally first.
+_TRANSACTION_TYPE_BY_VALUE: dict[str, TransactionType] = {m.value: m for m in TransactionType}
+_TRANSACTION_TYPE_VALUES: frozenset[str] = frozenset(_TRANSACTION_TYPE_BY_VALUE)
+
+
+# Plain-str entity types for hot comparisons and dict lookups (skips Enum.__eq__)
+_MERCHANT = EntityType.MERCHANT.value
+_LOCATION = EntityType.LOCATION.value
+_INTERMEDIARY = EntityType.INTERMEDIARY.value
+_PERSON = EntityType.PERSON.value
+
+
 # Request Models
 
+# Plain-str TransactionType values for request payloads (skips the Enum.value descriptor)
+_TYPE_VALUE = {m: m.value for m in TransactionType}
+
 
 class Transaction(BaseModel):
     """Input transaction to enrich."""
 
     title: str = Field(..., min_length=1, max_length=256, description="Transaction title from bank statement")
-    country: str = Field(..., pattern=r"^[A-Za-z]{2}$", description="ISO 3166-1 alpha-2 country code")
+    country: str = Field(..., description="ISO 3166-1 alpha-2 country code")
     type: TransactionType = Field(..., description="Transaction direction (expense/income)")
     comment: str | None = Field(None, description="Optional comment about the transaction")
 
+    @field_validator("country")
+    @classmethod
+    def normalize_country(cls, v: str) -> str:
+        """Check for two ASCII letters and store the code upper-cased, as the API expects it.
+
+        Plain str checks rather than a regex, since this validator runs anyway.
+        Interned: a file has only a handful of distinct countries, so every
+        transaction shares one string object per country.
+        """
+        if not (len(v) == 2 and v.isascii() and v.isalpha()):
+            raise ValueError("must be a 2-letter ISO 3166-1 alpha-2 country code")
+        return sys.intern(v.upper())
+
     def to_api_request(self) -> dict[str, str]:
         """Convert to API request payload."""
         return {
             "title": self.title,
-            "country": self.country.upper(),
-            "type": self.type.value,
+            "country": self.country,
+            "type": _TYPE_VALUE[self.type],
         }
 
 
@@ -78,6 +127,8 @@ class Transaction(BaseModel):
 class Coordinates(BaseModel):
     """Geographic coordinates."""
 
+    model_config = {"extra": "ignore", "frozen": True}
+
     latitude: float
     longitude: float
 
@@ -85,6 +136,8 @@ class Coordinates(BaseModel):
 class CategoryCode(BaseModel):
     """Industry classification codes."""
 
+    model_config = {"extra": "ignore", "frozen": True}
+
     mcc: int | None = Field(None, description="Merchant Category Code")
     sic: int | None = Field(None, description="Standard Industrial Classification")
     naics: int | None = Field(None, description="NAICS code")
@@ -97,12 +150,11 @@ class Category(BaseModel):
     """
 
     name: str
-    # Nested code object (from API responses)
-    code: CategoryCode | None = None
-    # Flat fields (from CategoryInfo format in /v1/categories)
-    mcc: int | None = None
-    sic: int | None = None
-    naics: int | None = None
+    # Flat fields (from CategoryInfo format in /v1/categories), also read from the
+    # nested code object in API responses; a non-null flat value takes precedence.
+    mcc: int | None = Field(None, validation_alias=AliasChoices("mcc", AliasPath("code", "mcc")))
+    sic: int | None = Field(None, validation_alias=AliasChoices("sic", AliasPath("code", "sic")))
+    naics: int | None = Field(None, validation_alias=AliasChoices("naics", AliasPath("code", "naics")))
     # Additional fields from CategoryInfo
     type: str | None = None  # primary, secondary, tertiary
     level: int | None = None  # 1, 2, 3
@@ -111,39 +163,43 @@ class Category(BaseModel):
 
     @model_validator(mode="before")
     @classmethod
-    def normalize_category_codes(cls, data: Any) -> Any:
-        """Normalize category codes from either flat or nested format."""
-        if isinstance(data, dict):
-            # If we have flat mcc/sic/naics but no code object, create one
-            if "code" not in data and any(k in data for k in ("mcc", "sic", "naics")):
-                data["code"] = {
-                    "mcc": data.get("mcc"),
-                    "sic": data.get("sic"),
-                    "naics": data.get("naics"),
-                }
-            # If we have a code object, also set flat fields for convenience
-            elif "code" in data and isinstance(data["code"], dict):
-                data["mcc"] = data.get("mcc") or data["code"].get("mcc")
-                data["sic"] = data.get("sic") or data["code"].get("sic")
-                data["naics"] = data.get("naics") or data["code"].get("naics")
+    def _fall_back_to_nested_codes(cls, data: Any) -> Any:
+        """Accept code as a CategoryCode too; use code.<key> when the flat key is null or 0."""
+        if not isinstance(data, dict):
+            return data
+        code = data.get("code")
+        if isinstance(code, CategoryCode):
+            # AliasPath only reads from dicts
+            code = code.model_dump()
+            data = {**data, "code": code}
+        if isinstance(code, dict):
+            fallback = {
+                key: code[key]
+                for key in ("mcc", "sic", "naics")
+                if key in data and not data[key] and code.get(key)
+            }
+            if fallback:
+                return {**data, **fallback}
         return data
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def code(self) -> CategoryCode | None:
+        """Industry codes in the nested format, if any are set."""
+        if self.mcc is None and self.sic is None and self.naics is None:
+            return None
+        return CategoryCode(mcc=self.mcc, sic=self.sic, naics=self.naics)
+
     def get_mcc(self) -> int | None:
         """Get MCC code from either format."""
-        if self.code and self.code.mcc:
-            return self.code.mcc
         return self.mcc
 
     def get_sic(self) -> int | None:
         """Get SIC code from either format."""
-        if self.code and self.code.sic:
-            return self.code.sic
         return self.sic
 
     def get_naics(self) -> int | None:
         """Get NAICS code from either format."""
-        if self.code and self.code.naics:
-            return self.code.naics
         return self.naics
 
 
@@ -159,6 +215,8 @@ class CategoryStructure(BaseModel):
 class Subscription(BaseModel):
     """Subscription detection result."""
 
+    model_config = {"extra": "ignore", "frozen": True}
+
     recurring: bool
     type: SubscriptionType | None = None
 
@@ -245,6 +303,17 @@ class PersonData(BaseModel):
 
 # Entity Result (v1.1.0 entities array pattern)
 
+_EntityData = MerchantData | LocationData | IntermediaryData | PersonData
+
+_ENTITY_DATA_MODELS: dict[
+    str, type[MerchantData] | type[LocationData] | type[IntermediaryData] | type[PersonData]
+] = {
+    _MERCHANT: MerchantData,
+    _LOCATION: LocationData,
+    _INTERMEDIARY: IntermediaryData,
+    _PERSON: PersonData,
+}
+
 
 class EntityResult(BaseModel):
     """An enriched entity from the entities array.
@@ -253,6 +322,9 @@ class EntityResult(BaseModel):
     Only identified entities are included -- no "status: no_match" entries.
     """
 
+    # Frozen so the cached parsed_data can't go stale
+    model_config = {"frozen": True}
+
     type: str = Field(..., description="Entity type: merchant, location, intermediary, person")
     role: str = Field(..., description="Contextual role (e.g. organization, store_location, processor, recipient)")
     confidence: ConfidenceWithReasons = Field(default_factory=ConfidenceWithReasons)
@@ -260,67 +332,82 @@ class EntityResult(BaseModel):
 
     def get_name(self) -> str | None:
         """Get the primary display name from entity data, regardless of type."""
-        if self.type == EntityType.PERSON:
+        if self.type == _PERSON:
             return self.data.get("displayName")
         return self.data.get("name")
 
+    @cached_property
+    def parsed_data(self) -> _EntityData | None:
+        """The data parsed into the model for this entity type (validated once per instance).
+
+        None for entity types this client doesn't know about.
+        """
+        model = _ENTITY_DATA_MODELS.get(self.type)
+        return model.model_validate(self.data) if model else None
+
     def as_merchant(self) -> MerchantData | None:
         """Parse data as MerchantData if this is a merchant entity."""
-        if self.type == EntityType.MERCHANT:
-            return MerchantData.model_validate(self.data)
-        return None
+        return cast(MerchantData, self.parsed_data) if self.type == _MERCHANT else None
 
     def as_location(self) -> LocationData | None:
         """Parse data as LocationData if this is a location entity."""
-        if self.type == EntityType.LOCATION:
-            return LocationData.model_validate(self.data)
-        return None
+        return cast(LocationData, self.parsed_data) if self.type == _LOCATION else None
 
     def as_intermediary(self) -> IntermediaryData | None:
         """Parse data as IntermediaryData if this is an intermediary entity."""
-        if self.type == EntityType.INTERMEDIARY:
-            return IntermediaryData.model_validate(self.data)
-        return None
+        return cast(IntermediaryData, self.parsed_data) if self.type == _INTERMEDIARY else None
 
     def as_person(self) -> PersonData | None:
         """Parse data as PersonData if this is a person entity."""
-        if self.type == EntityType.PERSON:
-            return PersonData.model_validate(self.data)
-        return None
+        return cast(PersonData, self.parsed_data) if self.type == _PERSON else None
 
 
 # Transaction & Enrichment Data
 
 
+def _dict_category_name(category: dict[str, Any]) -> str:
+    """Primary category name from a raw API category (nested or flat format)."""
+    if "primary" in category:
+        primary = category["primary"]
+        if isinstance(primary, dict):
+            return primary.get("name", "Unknown")
+        if isinstance(primary, Category):
+            return primary.name
+    return category.get("name", "Unknown")
+
+
+# Primary category name by exact type of TransactionData.category (one dict lookup
+# instead of an isinstance chain); other types have no name.
+_CATEGORY_NAME_EXTRACTORS: dict[type, Callable[[Any], str]] = {
+    dict: _dict_category_name,
+    CategoryStructure: lambda category: category.primary.name,
+}
+
+
+def _coerce_confidence(value: Any) -> Any:
+    """Accept a plain int confidence (backward compat) as ConfidenceWithReasons."""
+    if isinstance(value, int):
+        return {"value": value, "reasons": []}
+    return value
+
+
 class TransactionData(BaseModel):
     """Enriched transaction data."""
 
-    model_config = {"extra": "allow"}
+    # Frozen so the cached category properties can't go stale
+    model_config = {"extra": "allow", "frozen": True}
 
     category: Any = None
     subscription: Subscription | None = None
-    channel: TransactionChannel | str = TransactionChannel.UNKNOWN
-    confidence: ConfidenceWithReasons = Field(default_factory=ConfidenceWithReasons)
-
-    @model_validator(mode="before")
-    @classmethod
-    def normalize_transaction_data(cls, data: Any) -> Any:
-        """Normalize transaction data from API response."""
-        if isinstance(data, dict):
-            # Handle channel as string
-            if "channel" in data and isinstance(data["channel"], str):
-                try:
-                    data["channel"] = TransactionChannel(data["channel"])
-                except ValueError:
-                    data["channel"] = TransactionChannel.UNKNOWN
-            # Handle confidence as plain int (backward compat) or as object
-            if "confidence" in data and isinstance(data["confidence"], int):
-                data["confidence"] = {"value": data["confidence"], "reasons": []}
-        return data
+    # Unrecognized channel strings map to UNKNOWN via TransactionChannel._missing_
+    channel: TransactionChannel = TransactionChannel.UNKNOWN
+    confidence: Annotated[ConfidenceWithReasons, BeforeValidator(_coerce_confidence)] = Field(
+        default_factory=ConfidenceWithReasons
+    )
 
-    @property
+    @cached_property
     def category_structure(self) -> CategoryStructure | None:
-        """Get category as a CategoryStructure if possible."""
+        """Get category as a CategoryStructure if possible (parsed once per instance)."""
         if self.category is None:
             return None
         if isinstance(self.category, CategoryStructure):
@@ -338,42 +425,48 @@ class TransactionData(BaseModel):
                 pass
         return None
 
+    @cached_property
+    def primary_category_name(self) -> str:
+        """The primary category name, or "Unknown" (computed once per instance)."""
+        extract = _CATEGORY_NAME_EXTRACTORS.get(type(self.category))
+        return extract(self.category) if extract else "Unknown"
+
     def get_primary_category_name(self) -> str:
         """Safely get the primary category name."""
-        if self.category is None:
-            return "Unknown"
-
-        if isinstance(self.category, CategoryStructure):
-            return self.category.primary.name
-
-        if isinstance(self.category, dict):
-            if "primary" in self.category:
-                primary = self.category["primary"]
-                if isinstance(primary, dict):
-                    return primary.get("name", "Unknown")
-                if isinstance(primary, Category):
-                    return primary.name
-            if "name" in self.category:
-                return self.category["name"]
+        return self.primary_category_name
 
-        return "Unknown"
-
-    def get_confidence_value(self) -> int:
-        """Get the numeric confidence value."""
+    @cached_property
+    def confidence_value(self) -> int:
+        """The numeric confidence value (computed once per instance)."""
         if isinstance(self.confidence, ConfidenceWithReasons):
             return self.confidence.value
         return 0
 
+    def get_confidence_value(self) -> int:
+        """Get the numeric confidence value."""
+        return self.confidence_value
+
 
 class EnrichmentData(BaseModel):
     """Complete enrichment data (v1.1.0 entities array pattern)."""
 
+    # Frozen so the cached entity lookups can't go stale
+    model_config = {"frozen": True}
+
     transaction: TransactionData
     entities: list[EntityResult] = Field(default_factory=list)
 
+    @cached_property
+    def _entity_by_type(self) -> dict[str, EntityResult]:
+        """First entity of each type (built on first lookup)."""
+        index: dict[str, EntityResult] = {}
+        for entity in self.entities:
+            index.setdefault(entity.type, entity)
+        return index
+
     def find_entity(self, entity_type: str) -> EntityResult | None:
         """Find the first entity of a given type."""
-        return next((e for e in self.entities if e.type == entity_type), None)
+        return self._entity_by_type.get(entity_type)
 
     def find_entities(self, entity_type: str) -> list[EntityResult]:
         """Find all entities of a given type."""
@@ -382,28 +475,33 @@ class EnrichmentData(BaseModel):
     @property
     def merchant(self) -> EntityResult | None:
         """Get the merchant entity, if present."""
-        return self.find_entity(EntityType.MERCHANT)
+        return self.find_entity(_MERCHANT)
 
     @property
     def location(self) -> EntityResult | None:
         """Get the location entity, if present."""
-        return self.find_entity(EntityType.LOCATION)
+        return self.find_entity(_LOCATION)
 
     @property
     def intermediary(self) -> EntityResult | None:
         """Get the first intermediary entity, if present."""
-        return self.find_entity(EntityType.INTERMEDIARY)
+        return self.find_entity(_INTERMEDIARY)
 
     @property
     def person(self) -> EntityResult | None:
         """Get the person entity, if present."""
-        return self.find_entity(EntityType.PERSON)
+        return self.find_entity(_PERSON)
 
-    def get_merchant_name(self) -> str | None:
-        """Convenience: get the merchant display name."""
+    @cached_property
+    def merchant_name(self) -> str | None:
+        """The merchant display name, if any (computed once per instance)."""
         merchant = self.merchant
         return merchant.get_name() if merchant else None
 
+    def get_merchant_name(self) -> str | None:
+        """Convenience: get the merchant display name."""
+        return self.merchant_name
+
     def get_intermediary_name(self) -> str | None:
         """Convenience: get the intermediary display name."""
         intermediary = self.intermediary
@@ -418,6 +516,8 @@ class EnrichmentData(BaseModel):
 class ResponseMeta(BaseModel):
     """Response metadata."""
 
+    model_config = {"extra": "ignore", "frozen": True}
+
     generatedAt: datetime
     requestId: str
     version: str
@@ -425,6 +525,13 @@ class ResponseMeta(BaseModel):
     errors: list[str] | None = None
 
 
+
+@lru_cache(maxsize=32)
+def _list_adapter(model_cls: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """One TypeAdapter per model for validating lists of it (building one is costly)."""
+    return TypeAdapter(list[model_cls])  # type: ignore[valid-type]
+
+
 class EnrichSuccessResponse(BaseModel):
     """Successful enrichment response."""
 
@@ -433,10 +540,17 @@ class EnrichSuccessResponse(BaseModel):
     data: EnrichmentData
     meta: ResponseMeta
 
+    @classmethod
+    def validate_many(cls, raw_list: list[Any]) -> list[EnrichSuccessResponse]:
+        """Validate a list of decoded responses in a single validator call."""
+        return _list_adapter(cls).validate_python(raw_list)
+
 
 class ErrorDetail(BaseModel):
     """Error details."""
 
+    model_config = {"extra": "ignore", "frozen": True}
+
     code: str
     message: str
     details: dict[str, Any] | None = None
@@ -450,6 +564,19 @@ class ErrorResponse(BaseModel):
     meta: ResponseMeta
 
 
+# Lower-cased header -> (RateLimitInfo field, allow_zero), allow_zero None for strings.
+# A drained bucket (0 remaining) is meaningful, unlike a 0 limit.
+_RL_HEADERS: dict[str, tuple[str, bool | None]] = {
+    "x-ratelimit-limit": ("limit", False),
+    "x-ratelimit-remaining": ("remaining", True),
+    "x-ratelimit-reset": ("reset", None),
+    "x-ratelimit-scope": ("scope", None),
+    "x-ratelimit-concurrency-limit": ("concurrency_limit", False),
+    "x-ratelimit-concurrency-remaining": ("concurrency_remaining", True),
+    "retry-after": ("retry_after_seconds", False),
+}
+
+
 class RateLimitInfo(BaseModel):
     """Rate limit information from response headers (API v1.1.2).
 
@@ -458,6 +585,8 @@ class RateLimitInfo(BaseModel):
     by X-RateLimit-Scope.  Retry-After is in **seconds**.
     """
 
+    model_config = {"extra": "ignore", "frozen": True}
+
     # RPS bucket
     limit: int | None = None
     remaining: int | None = None
@@ -472,24 +601,28 @@ class RateLimitInfo(BaseModel):
     retry_after_seconds: int | None = None
 
     @classmethod
-    def from_headers(cls, headers: dict[str, str]) -> RateLimitInfo:
-        """Parse rate limit info from response headers."""
-        def _int(key: str) -> int | None:
+    def from_headers(cls, headers: Mapping[str, str]) -> RateLimitInfo:
+        """Parse rate limit info from response headers (matched case-insensitively).
+
+        Walks the headers once instead of looking up each rate-limit header.
+        """
+        fields: dict[str, Any] = {}
+        for key, value in headers.items():
+            spec = _RL_HEADERS.get(key.lower())
+            if spec is None:
+                continue
+            name, allow_zero = spec
+            if allow_zero is None:  # string-valued header
+                if value:
+                    fields[name] = value
+                continue
             try:
-                v = int(headers.get(key, 0))
-                return v if v > 0 else None
-            except (ValueError, TypeError):
-                return None
-
-        return cls(
-            limit=_int("X-RateLimit-Limit"),
-            remaining=_int("X-RateLimit-Remaining"),
-            reset=headers.get("X-RateLimit-Reset") or None,
-            scope=headers.get("X-RateLimit-Scope") or None,
-            concurrency_limit=_int("X-RateLimit-Concurrency-Limit"),
-            concurrency_remaining=_int("X-RateLimit-Concurrency-Remaining"),
-            retry_after_seconds=_int("Retry-After"),
-        )
+                v = int(value)
+            except ValueError:
+                continue
+            if v > 0 or (allow_zero and v == 0):
+                fields[name] = v
+        return cls(**fields)
 
     def get_reset_timestamp(self) -> float | None:
         """Parse the ISO reset timestamp to a Unix timestamp for comparison."""
@@ -515,3 +648,11 @@ class EnrichmentResult(BaseModel):
     error: ErrorDetail | None = None
     request_id: str | None = None
     processing_time_ms: float | None = None
+
+    def get_merchant_name(self) -> str | None:
+        """Get the merchant display name, or None if not enriched or no merchant."""
+        return self.data.merchant_name if self.data else None
+
+    def get_category_name(self) -> str | None:
+        """Get the primary category name, or None if not enriched."""
+        return self.data.transaction.primary_category_name if self.data else None
@@ -0,0 +1,110 @@
+"""Tests for TriqaiClient against a mocked Triqai API (httpx.MockTransport)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+
+import httpx
+import orjson
+import pytest
+
+from src import Transaction, TriqaiClient
+from src.models import RateLimitInfo, TransactionType
+
+Handler = Callable[[httpx.Request], Coroutine[None, None, httpx.Response]]
+
+META = {"generatedAt": "2026-01-01T00:00:00Z", "requestId": "req_1", "version": "1.1.0"}
+
+
+def success_envelope(title: str) -> dict[str, object]:
+    """A single-enrichment success response whose merchant is named after the title."""
+    return {
+        "success": True,
+        "partial": False,
+        "data": {
+            "transaction": {"category": {"primary": {"name": "Food"}}},
+            "entities": [{"type": "merchant", "role": "organization", "data": {"name": title}}],
+        },
+        "meta": META,
+    }
+
+
+def make_client(handler: Handler, max_concurrent: int = 2) -> TriqaiClient:
+    """A client whose HTTP requests are answered by *handler* (call from a running loop)."""
+    client = TriqaiClient("test_key", max_concurrent=max_concurrent, request_delay=0.0)
+    client._client = httpx.AsyncClient(base_url=client.BASE_URL, transport=httpx.MockTransport(handler))
+    client._client_loop = asyncio.get_running_loop()
+    return client
+
+
+def make_transactions(n: int) -> list[Transaction]:
+    return [Transaction(title=f"TXN {i}", country="US", type=TransactionType.EXPENSE, comment=None) for i in range(n)]
+
+
+async def single_endpoint(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0.001)  # yield, so concurrent requests interleave
+    return httpx.Response(200, json=success_envelope(orjson.loads(request.content)["title"]))
+
+
+@pytest.mark.parametrize(
+    ("count", "chunk_size", "max_concurrent"),
+    [(20, 2, 2), (100, 5, 2), (40, 4, 3)],
+)
+async def test_bulk_falls_back_to_single_requests_on_404(
+    count: int, chunk_size: int, max_concurrent: int
+) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == TriqaiClient.BATCH_ENDPOINT:
+            await asyncio.sleep(0.001)
+            return httpx.Response(404, json={})
+        return await single_endpoint(request)
+
+    transactions = make_transactions(count)
+    async with make_client(handler, max_concurrent) as client:
+        results = await asyncio.wait_for(
+            client.enrich_batch_bulk(transactions, chunk_size=chunk_size), timeout=10
+        )
+
+        assert [r.get_merchant_name() for r in results] == [t.title for t in transactions]
+        assert not client._bulk_supported
+        assert client._inflight == 0
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"results": "missing"},  # wrong results type
+        {"data": []},  # no results array
+        None,  # one envelope short per chunk (filled in by the handler)
+    ],
+)
+async def test_bulk_rejects_results_that_do_not_match_the_chunk(body: dict[str, object] | None) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        titles = [t["title"] for t in orjson.loads(request.content)["transactions"]]
+        if body is not None:
+            return httpx.Response(200, json=body)
+        return httpx.Response(200, json={"results": [success_envelope(t) for t in titles[:-1]]})
+
+    transactions = make_transactions(23)
+    async with make_client(handler) as client:
+        results = await client.enrich_batch_bulk(transactions, chunk_size=5)
+
+    assert [r.input for r in results] == transactions
+    assert all(not r.success and r.error and r.error.code == "invalid_response" for r in results)
+
+
+async def test_drained_bucket_waiters_sleep_concurrently() -> None:
+    client = TriqaiClient("test_key", max_concurrent=5, request_delay=0.0)
+    client._rate_limit_info = RateLimitInfo(limit=5, remaining=0, retry_after_seconds=1)
+
+    start = time.monotonic()
+    await asyncio.gather(*(client._wait_for_rate_limit() for _ in range(5)))
+    elapsed = time.monotonic() - start
+
+    # One shared deadline (Retry-After + buffer), not five back-to-back waits.
+    assert 1.0 <= elapsed < 1.5
+    start = time.monotonic()
+    await client._wait_for_rate_limit()  # deadline already passed for this response
+    assert time.monotonic() - start < 0.1
@@ -0,0 +1,69 @@
+"""Tests for TransactionEnricher's CSV loaders."""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src import TransactionEnricher, TriqaiClient
+from src.models import Transaction, TransactionType
+
+Loader = Callable[[TransactionEnricher, Path], list[Transaction]]
+
+LOADERS = [
+    pytest.param(lambda e, p: list(e.iter_transactions_from_csv(p)), id="stdlib"),
+    pytest.param(
+        lambda e, p: e.load_transactions_from_csv_fast(p),
+        id="pyarrow",
+        marks=pytest.mark.skipif(
+            importlib.util.find_spec("pyarrow") is None, reason="pyarrow not installed"
+        ),
+    ),
+]
+
+
+def load(loader: Loader, tmp_path: Path, body: str) -> list[Transaction]:
+    csv_path = tmp_path / "transactions.csv"
+    csv_path.write_text("title,country,type\n" + body, encoding="utf-8")
+    enricher = TransactionEnricher(TriqaiClient("test_key"), output_dir=tmp_path)
+    return loader(enricher, csv_path)
+
+
+@pytest.mark.parametrize("loader", LOADERS)
+def test_blank_lines_are_skipped_silently(
+    loader: Loader, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.WARNING):
+        transactions = load(loader, tmp_path, "A,US,expense\n\nB,GB,income\n\n")
+
+    assert [t.title for t in transactions] == ["A", "B"]
+    assert caplog.messages == []
+
+
+@pytest.mark.parametrize("loader", LOADERS)
+def test_short_rows_are_reported_and_skipped(
+    loader: Loader, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.WARNING):
+        transactions = load(loader, tmp_path, "A,US,expense\nB\nC,GB,income\n")
+
+    assert [t.title for t in transactions] == ["A", "C"]
+    assert "Row 3: Missing required value(s), got 1 columns" in caplog.messages
+
+
+@pytest.mark.parametrize("loader", LOADERS)
+@pytest.mark.parametrize(
+    ("body", "row"), [("A,US,income\nB,US,Bogus\n", 3), ("A,US,income\n\nB,US,Bogus\n", 4)]
+)
+def test_invalid_type_defaults_to_expense_with_file_row_number(
+    loader: Loader, body: str, row: int, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.WARNING):
+        transactions = load(loader, tmp_path, body)
+
+    assert [t.type for t in transactions] == [TransactionType.INCOME, TransactionType.EXPENSE]
+    assert caplog.messages == [f"Row {row}: Invalid type 'bogus', defaulting to 'expense'"]
@@ -0,0 +1,59 @@
+"""Tests for the Triqai API data models."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from src.models import Category, CategoryCode, EnrichmentData, EntityResult, TransactionData
+
+
+@pytest.mark.parametrize(
+    ("data", "mcc"),
+    [
+        ({"name": "Groceries", "code": {"mcc": 5411}}, 5411),
+        ({"name": "Groceries", "mcc": 5411}, 5411),
+        ({"name": "Groceries", "mcc": 5412, "code": {"mcc": 5411}}, 5412),
+        ({"name": "Groceries", "mcc": None, "code": {"mcc": 5411}}, 5411),
+        ({"name": "Groceries", "mcc": None, "code": None}, None),
+        ({"name": "Groceries", "code": CategoryCode.model_validate({"mcc": 5411})}, 5411),
+        ({"name": "Groceries", "mcc": None, "code": CategoryCode.model_validate({"mcc": 5411})}, 5411),
+    ],
+)
+def test_category_reads_flat_or_nested_codes(data: dict[str, object], mcc: int | None) -> None:
+    original = {**data}
+    category = Category.model_validate(data)
+
+    assert category.mcc == mcc
+    assert (category.code.mcc if category.code else None) == mcc
+    assert data == original
+
+
+def test_enrichment_data_equality_ignores_cached_entity_index() -> None:
+    data = {
+        "transaction": {"category": {"name": "Groceries"}},
+        "entities": [{"type": "merchant", "role": "organization", "data": {"name": "Tesco"}}],
+    }
+    a = EnrichmentData.model_validate(data)
+    b = EnrichmentData.model_validate(data)
+
+    assert a.merchant is not None and a.merchant.get_name() == "Tesco"
+    assert a == b
+
+
+@pytest.mark.parametrize(
+    ("model", "cached", "field", "value"),
+    [
+        (TransactionData(category={"name": "A"}), "primary_category_name", "category", {"name": "B"}),
+        (EntityResult(type="merchant", role="organization", data={"name": "A"}), "parsed_data", "data", {}),
+        (EnrichmentData(transaction=TransactionData()), "merchant_name", "entities", []),
+    ],
+)
+def test_models_with_cached_properties_are_frozen(
+    model: object, cached: str, field: str, value: object
+) -> None:
+    before = getattr(model, cached)
+
+    with pytest.raises(ValidationError):
+        setattr(model, field, value)
+    assert getattr(model, cached) == before